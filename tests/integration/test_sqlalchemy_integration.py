@@ -562,6 +562,113 @@ def test_get_table_comment(trino_connection):
         metadata.drop_all(engine)
 
 
+@pytest.mark.parametrize('trino_connection', ['memory'], indirect=True)
+def test_get_indexes(trino_connection):
+    engine, conn = trino_connection
+
+    if not engine.dialect.has_schema(conn, "test"):
+        with engine.begin() as connection:
+            connection.execute(sqla.schema.CreateSchema("test"))
+    metadata = sqla.MetaData()
+
+    try:
+        sqla.Table(
+            'test_get_indexes',
+            metadata,
+            sqla.Column('id', sqla.Integer),
+            schema="test",
+        )
+        metadata.create_all(engine)
+        insp = sqla.inspect(conn)
+        assert insp.get_indexes("test_get_indexes", schema="test") == []
+        with pytest.raises(sqla.exc.NoSuchTableError):
+            insp.get_indexes("test_get_indexes_missing", schema="test")
+    finally:
+        metadata.drop_all(engine)
+
+
+@pytest.mark.parametrize('trino_connection', ['hive'], indirect=True)
+def test_get_indexes_hive(trino_connection):
+    engine, conn = trino_connection
+    if "hive" not in engine.dialect.get_catalog_names(conn):
+        pytest.skip("hive catalog is not configured")
+
+    if not engine.dialect.has_schema(conn, "test"):
+        with engine.begin() as connection:
+            connection.execute(sqla.schema.CreateSchema("test"))
+
+    try:
+        with engine.begin() as connection:
+            connection.execute(sqla.text(
+                "CREATE TABLE test.test_get_indexes_partitioned (id INTEGER, year VARCHAR, month VARCHAR) "
+                "WITH (partitioned_by = ARRAY['year', 'month'])"
+            ))
+            connection.execute(sqla.text("CREATE TABLE test.test_get_indexes_unpartitioned (id INTEGER)"))
+        insp = sqla.inspect(conn)
+        assert insp.get_indexes("test_get_indexes_partitioned", schema="test") == [
+            dict(name="partition", column_names=["year", "month"], unique=False)
+        ]
+        assert insp.get_indexes("test_get_indexes_unpartitioned", schema="test") == []
+        with pytest.raises(sqla.exc.NoSuchTableError):
+            insp.get_indexes("test_get_indexes_missing", schema="test")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(sqla.text("DROP TABLE IF EXISTS test.test_get_indexes_partitioned"))
+            connection.execute(sqla.text("DROP TABLE IF EXISTS test.test_get_indexes_unpartitioned"))
+
+
+@pytest.mark.skipif(
+    sqlalchemy_version() < "2.0",
+    reason="get_multi_* reflection methods are only used as of SQLAlchemy 2.0"
+)
+@pytest.mark.parametrize('trino_connection', ['memory'], indirect=True)
+def test_get_multi_columns(trino_connection):
+    engine, conn = trino_connection
+
+    if not engine.dialect.has_schema(conn, "test"):
+        with engine.begin() as connection:
+            connection.execute(sqla.schema.CreateSchema("test"))
+    metadata = sqla.MetaData()
+
+    try:
+        sqla.Table(
+            'test_get_multi_columns_users',
+            metadata,
+            sqla.Column('id', sqla.BigInteger),
+            sqla.Column('name', sqla.String),
+            schema="test",
+        )
+        sqla.Table(
+            'test_get_multi_columns_orders',
+            metadata,
+            sqla.Column('id', sqla.BigInteger),
+            schema="test",
+        )
+        metadata.create_all(engine)
+        insp = sqla.inspect(engine)
+
+        columns = insp.get_multi_columns(
+            schema="test",
+            filter_names=["test_get_multi_columns_users", "test_get_multi_columns_orders", "missing"],
+        )
+        assert set(columns.keys()) == {
+            ("test", "test_get_multi_columns_users"),
+            ("test", "test_get_multi_columns_orders"),
+        }
+        assert [column["name"] for column in columns[("test", "test_get_multi_columns_users")]] == ["id", "name"]
+        assert [column["name"] for column in columns[("test", "test_get_multi_columns_orders")]] == ["id"]
+
+        comments = insp.get_multi_table_comment(schema="test", filter_names=["test_get_multi_columns_users"])
+        assert comments == {("test", "test_get_multi_columns_users"): dict(text=None)}
+
+        table = sqla.Table("test_get_multi_columns_users", sqla.MetaData(), schema="test", autoload_with=conn)
+        assert [column.name for column in table.columns] == ["id", "name"]
+        assert isinstance(table.c.id.type, sqla.BigInteger)
+        assert isinstance(table.c.name.type, sqla.String)
+    finally:
+        metadata.drop_all(engine)
+
+
 @pytest.mark.parametrize('trino_connection', ['memory/test'], indirect=True)
 @pytest.mark.parametrize('schema', [None, 'test'])
 def test_get_table_names(trino_connection, schema):
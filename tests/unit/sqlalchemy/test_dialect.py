@@ -3,9 +3,13 @@ from unittest import mock
 
 import pytest
 from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.sql.sqltypes import BIGINT, VARCHAR
 
+from tests.unit.conftest import sqlalchemy_version
 from trino.auth import BasicAuthentication, OAuth2Authentication
 from trino.dbapi import Connection
+from trino.exceptions import TrinoQueryError
 from trino.sqlalchemy import URL as trino_url
 from trino.sqlalchemy.dialect import (
     CertificateAuthentication,
@@ -237,6 +241,18 @@ class TestTrinoDialect:
         assert actual_args == expected_args
         assert actual_kwargs == expected_kwargs
 
+    def test_create_connect_args_query_decoded_once(self):
+        url = make_url(trino_url(
+            host="localhost",
+            source="a+b %2B",
+            client_tags=["c+d", "%41"],
+        ))
+
+        _, kwargs = self.dialect.create_connect_args(url)
+
+        assert kwargs["source"] == "a+b %2B"
+        assert kwargs["client_tags"] == ["c+d", "%41"]
+
     def test_create_connect_args_missing_user_when_specify_password(self):
         url = make_url("trino://:pass@localhost")
         with pytest.raises(ValueError, match="Username is required when specify password in connection URL"):
@@ -247,6 +263,193 @@ class TestTrinoDialect:
         with pytest.raises(ValueError, match="Unexpected database format catalog/schema/foobar"):
             self.dialect.create_connect_args(url)
 
+    def test_get_columns(self):
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = [
+            ["id", "bigint", None, "NO"],
+            ["name", "varchar", "'unknown'", "YES"],
+        ]
+
+        columns = self.dialect._get_columns(connection, "users")
+
+        cursor.execute.assert_called_once_with(mock.ANY, ["default", "users"])
+        assert [column["name"] for column in columns] == ["id", "name"]
+        assert isinstance(columns[0]["type"], BIGINT)
+        assert isinstance(columns[1]["type"], VARCHAR)
+        assert [column["nullable"] for column in columns] == [False, True]
+        assert [column["default"] for column in columns] == [None, "'unknown'"]
+
+    def test_get_columns_no_such_table(self):
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        connection.connection.cursor.return_value.fetchall.return_value = []
+
+        with pytest.raises(NoSuchTableError):
+            self.dialect.get_columns(connection, "users")
+        connection.connection.cursor.return_value.execute.assert_called_once()
+
+    def test_get_table_names_cached(self):
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = [["users"], ["orders"]]
+        info_cache: Dict[Any, Any] = {}
+
+        assert self.dialect.get_table_names(connection, info_cache=info_cache) == ["users", "orders"]
+        assert self.dialect.get_table_names(connection, info_cache=info_cache) == ["users", "orders"]
+        cursor.execute.assert_called_once()
+
+    def test_get_multi_table_names(self):
+        connection = mock.Mock()
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = [["sales", "orders"], ["hr", "employees"], ["sales", "customers"]]
+
+        table_names = self.dialect.get_multi_table_names(connection, ["sales", "hr", "empty"])
+
+        cursor.execute.assert_called_once_with(mock.ANY, ["sales", "hr", "empty"])
+        assert table_names == {"sales": ["orders", "customers"], "hr": ["employees"], "empty": []}
+
+    @pytest.mark.parametrize(
+        "rows, expected_indexes",
+        [
+            ([[None, 0]], []),
+            (
+                [[None, 0], ["year", 1], ["month", 2]],
+                [dict(name="partition", column_names=["year", "month"], unique=False)],
+            ),
+        ],
+    )
+    def test_get_indexes(self, rows: List[List[Any]], expected_indexes: List[Dict[str, Any]]):
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = rows
+
+        assert self.dialect.get_indexes(connection, "users") == expected_indexes
+        cursor.execute.assert_called_once_with(mock.ANY, ["default", "users$partitions", "default", "users"])
+
+    def test_get_indexes_no_such_table(self):
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        connection.connection.cursor.return_value.fetchall.return_value = []
+
+        with pytest.raises(NoSuchTableError):
+            self.dialect.get_indexes(connection, "users")
+
+    @pytest.mark.skipif(
+        sqlalchemy_version() < "2.0",
+        reason="get_multi_* reflection methods are only used as of SQLAlchemy 2.0"
+    )
+    def test_get_multi_columns(self):
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = [
+            ["orders", "id", "bigint", None, "NO"],
+            ["users", "id", "bigint", None, "NO"],
+            ["users", "name", "varchar", None, "YES"],
+        ]
+
+        columns = dict(self.dialect.get_multi_columns(
+            connection,
+            schema=None,
+            filter_names=["users", "orders", "missing"],
+            scope=ObjectScope.ANY,
+            kind=ObjectKind.ANY,
+        ))
+
+        cursor.execute.assert_called_once_with(mock.ANY, ["default", "users", "orders", "missing"])
+        assert list(columns.keys()) == [(None, "users"), (None, "orders")]
+        assert [column["name"] for column in columns[(None, "users")]] == ["id", "name"]
+        assert [column["name"] for column in columns[(None, "orders")]] == ["id"]
+
+    @pytest.mark.skipif(
+        sqlalchemy_version() < "2.0",
+        reason="get_multi_* reflection methods are only used as of SQLAlchemy 2.0"
+    )
+    def test_get_multi_columns_filters_table_names(self):
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        connection = mock.Mock()
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.side_effect = [
+            [["users"], ["orders"]],
+            [],
+            [["users", "id", "bigint", None, "NO"]],
+        ]
+
+        columns = dict(self.dialect.get_multi_columns(
+            connection,
+            schema=None,
+            filter_names=["users", "missing"],
+            scope=ObjectScope.DEFAULT,
+            kind=ObjectKind.ANY,
+        ))
+
+        # With a scope other than ANY the names are looked up instead of being taken as given
+        assert cursor.execute.call_count == 3
+        cursor.execute.assert_called_with(mock.ANY, ["default", "users"])
+        assert list(columns.keys()) == [(None, "users")]
+
+    @pytest.mark.skipif(
+        sqlalchemy_version() < "2.0",
+        reason="get_multi_* reflection methods are only used as of SQLAlchemy 2.0"
+    )
+    def test_get_multi_table_comment(self):
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        connection = mock.Mock()
+        connection.connection.catalog = "hive"
+        connection.connection.schema = "default"
+        cursor = connection.connection.cursor.return_value
+        cursor.fetchall.return_value = [["users", "All users"]]
+
+        comments = dict(self.dialect.get_multi_table_comment(
+            connection,
+            schema=None,
+            filter_names=["users", "orders"],
+            scope=ObjectScope.ANY,
+            kind=ObjectKind.ANY,
+        ))
+
+        cursor.execute.assert_called_once_with(mock.ANY, ["hive", "default", "users", "orders"])
+        assert comments == {
+            (None, "users"): dict(text="All users"),
+            (None, "orders"): dict(text=None),
+        }
+
+    @pytest.mark.skipif(
+        sqlalchemy_version() < "2.0",
+        reason="get_multi_* reflection methods are only used as of SQLAlchemy 2.0"
+    )
+    def test_get_multi_table_comment_permission_denied(self):
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        connection = mock.Mock()
+        connection.connection.catalog = "hive"
+        connection.connection.schema = "default"
+        connection.connection.cursor.return_value.execute.side_effect = TrinoQueryError(
+            {"errorName": "PERMISSION_DENIED"}
+        )
+
+        comments = dict(self.dialect.get_multi_table_comment(
+            connection,
+            schema="sales",
+            filter_names=["users", "orders"],
+            scope=ObjectScope.ANY,
+            kind=ObjectKind.ANY,
+        ))
+
+        assert comments == {
+            ("sales", "users"): dict(text=None),
+            ("sales", "orders"): dict(text=None),
+        }
+
     def test_get_default_isolation_level(self):
         isolation_level = self.dialect.get_default_isolation_level(mock.Mock())
         assert isolation_level == "AUTOCOMMIT"
@@ -9,9 +9,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import json
-from textwrap import dedent
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 from urllib.parse import unquote_plus
 
 from sqlalchemy import exc, sql
@@ -20,6 +20,7 @@ from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.default import DefaultDialect, DefaultExecutionContext
 from sqlalchemy.engine.url import URL
 from sqlalchemy.sql import sqltypes
+from sqlalchemy.sql.elements import quoted_name
 
 from trino import dbapi as trino_dbapi
 from trino import logging
@@ -41,6 +42,179 @@ colspecs = {
     sqltypes.JSON.JSONPathType: JSONPathType,
 }
 
+_COLUMNS_QUERY = """
+SELECT
+    "column_name",
+    "data_type",
+    "column_default",
+    UPPER("is_nullable") AS "is_nullable"
+FROM "information_schema"."columns"
+WHERE "table_schema" = ?
+  AND "table_name" = ?
+ORDER BY "ordinal_position" ASC
+""".strip()
+
+_MULTI_COLUMNS_QUERY = """
+SELECT
+    "table_name",
+    "column_name",
+    "data_type",
+    "column_default",
+    UPPER("is_nullable") AS "is_nullable"
+FROM "information_schema"."columns"
+WHERE "table_schema" = ?
+""".strip()
+
+_CATALOG_NAMES_QUERY = """
+SELECT "table_cat"
+FROM "system"."jdbc"."catalogs"
+""".strip()
+
+_SCHEMA_NAMES_QUERY = """
+SELECT "schema_name"
+FROM "information_schema"."schemata"
+""".strip()
+
+_TABLE_NAMES_QUERY = """
+SELECT "table_name"
+FROM "information_schema"."tables"
+WHERE "table_schema" = ?
+  AND "table_type" = 'BASE TABLE'
+""".strip()
+
+# Querying the information_schema.views table is subpar as it compiles the view definitions.
+_VIEW_NAMES_QUERY = """
+SELECT "table_name"
+FROM "information_schema"."tables"
+WHERE "table_schema" = ?
+  AND "table_type" = 'VIEW'
+""".strip()
+
+_MULTI_TABLE_NAMES_QUERY = """
+SELECT "table_schema", "table_name"
+FROM "information_schema"."tables"
+WHERE "table_type" = 'BASE TABLE'
+""".strip()
+
+_MULTI_TABLE_COMMENT_QUERY = """
+SELECT "table_name", "comment"
+FROM "system"."metadata"."table_comments"
+WHERE "catalog_name" = ?
+  AND "schema_name" = ?
+""".strip()
+
+# Returns the partition columns, preceded by a row with a NULL column name if the table exists
+_PARTITIONS_QUERY = """
+SELECT "column_name", "ordinal_position"
+FROM "information_schema"."columns"
+WHERE "table_schema" = ?
+  AND "table_name" = ?
+UNION ALL
+SELECT NULL, 0
+FROM "information_schema"."tables"
+WHERE "table_schema" = ?
+  AND "table_name" = ?
+ORDER BY 2 ASC
+""".strip()
+
+_HAS_SCHEMA_QUERY = """
+SELECT "schema_name"
+FROM "information_schema"."schemata"
+WHERE "schema_name" = ?
+""".strip()
+
+_HAS_TABLE_QUERY = """
+SELECT "table_name"
+FROM "information_schema"."tables"
+WHERE "table_schema" = ?
+  AND "table_name" = ?
+""".strip()
+
+# Statements executed through SQLAlchemy are parsed once at import time rather than on every call
+_VIEW_DEFINITION_QUERY = sql.text("""
+SELECT "view_definition"
+FROM "information_schema"."views"
+WHERE "table_schema" = :schema
+  AND "table_name" = :view
+""".strip())
+
+_TABLE_COMMENT_QUERY = sql.text("""
+SELECT "comment"
+FROM "system"."metadata"."table_comments"
+WHERE "catalog_name" = :catalog_name
+  AND "schema_name" = :schema_name
+  AND "table_name" = :table_name
+""".strip())
+
+_VERSION_QUERY = sql.text("SELECT version()")
+
+
+def _parse_extra_credential(value: str) -> List[Tuple[str, str]]:
+    return [(key, secret) for key, secret in json.loads(value)]
+
+
+# URL query parameters passed through to the DBAPI connection, mapped to the function parsing their value.
+# SQLAlchemy already percent-decodes the values of URL.query, so they must not be unquoted a second time.
+_QUERY_PARAMETERS: Dict[str, Callable[[str], Any]] = {
+    "source": str,
+    "session_properties": json.loads,
+    "http_headers": json.loads,
+    "extra_credential": _parse_extra_credential,
+    "client_tags": json.loads,
+    "legacy_primitive_types": json.loads,
+    "legacy_prepared_statements": json.loads,
+    "verify": json.loads,
+    "roles": json.loads,
+}
+
+
+_UNCACHED_KWARGS = frozenset(("info_cache", "unreflectable"))
+
+
+def _reflection_cache(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Memoizes a reflection method in the info_cache passed by SQLAlchemy's Inspector.
+
+    Mirrors sqlalchemy.engine.reflection.cache, which can't wrap methods with subscripted return annotations on
+    SQLAlchemy < 2.0.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, connection: Connection, *args: Any, **kw: Any) -> Any:
+        info_cache = kw.get("info_cache")
+        if info_cache is None:
+            return fn(self, connection, *args, **kw)
+        key = (
+            fn.__name__,
+            tuple(_cache_key_part(arg) for arg in args if isinstance(arg, str)),
+            tuple((name, _cache_key_part(value)) for name, value in kw.items() if name not in _UNCACHED_KWARGS),
+        )
+        result = info_cache.get(key)
+        if result is None:
+            result = fn(self, connection, *args, **kw)
+            info_cache[key] = result
+        return result
+    return wrapper
+
+
+def _cache_key_part(value: Any) -> Any:
+    # quoted_name compares equal to the plain string, keep the quoting in the key like SQLAlchemy does
+    if isinstance(value, quoted_name):
+        return str(value), value.quote
+    return value
+
+
+def _in_list_filter(column: str, values: Sequence[Any]) -> str:
+    return f'\n  AND "{column}" IN ({", ".join("?" * len(values))})'
+
+
+def _to_column(row: Sequence[Any]) -> Dict[str, Any]:
+    column_name, data_type, column_default, is_nullable = row
+    return dict(
+        name=column_name,
+        type=datatype.parse_sqltype(data_type),
+        nullable=is_nullable == "YES",
+        default=column_default,
+    )
+
 
 class TrinoDialect(DefaultDialect):
     def __init__(self,
@@ -129,80 +303,61 @@ class TrinoDialect(DefaultDialect):
 
         if "access_token" in url.query:
             kwargs["http_scheme"] = "https"
-            kwargs["auth"] = JWTAuthentication(unquote_plus(url.query["access_token"]))
+            kwargs["auth"] = JWTAuthentication(url.query["access_token"])
 
         if "cert" and "key" in url.query:
             kwargs["http_scheme"] = "https"
-            kwargs["auth"] = CertificateAuthentication(unquote_plus(url.query['cert']), unquote_plus(url.query['key']))
+            kwargs["auth"] = CertificateAuthentication(url.query['cert'], url.query['key'])
 
         if "externalAuthentication" in url.query:
             kwargs["http_scheme"] = "https"
             kwargs["auth"] = OAuth2Authentication()
 
-        if "source" in url.query:
-            kwargs["source"] = unquote_plus(url.query["source"])
-        else:
-            kwargs["source"] = "trino-sqlalchemy"
-
-        if "session_properties" in url.query:
-            kwargs["session_properties"] = json.loads(unquote_plus(url.query["session_properties"]))
-
-        if "http_headers" in url.query:
-            kwargs["http_headers"] = json.loads(unquote_plus(url.query["http_headers"]))
-
-        if "extra_credential" in url.query:
-            kwargs["extra_credential"] = [
-                tuple(extra_credential) for extra_credential in json.loads(unquote_plus(url.query["extra_credential"]))
-            ]
-
-        if "client_tags" in url.query:
-            kwargs["client_tags"] = json.loads(unquote_plus(url.query["client_tags"]))
-
-        if "legacy_primitive_types" in url.query:
-            kwargs["legacy_primitive_types"] = json.loads(unquote_plus(url.query["legacy_primitive_types"]))
-
-        if "legacy_prepared_statements" in url.query:
-            kwargs["legacy_prepared_statements"] = json.loads(unquote_plus(url.query["legacy_prepared_statements"]))
-
-        if "verify" in url.query:
-            kwargs["verify"] = json.loads(unquote_plus(url.query["verify"]))
-
-        if "roles" in url.query:
-            kwargs["roles"] = json.loads(url.query["roles"])
+        kwargs["source"] = "trino-sqlalchemy"
+        for key, value in url.query.items():
+            parse = _QUERY_PARAMETERS.get(key)
+            if parse is not None:
+                kwargs[key] = parse(value)
 
         return args, kwargs
 
+    @_reflection_cache
     def get_columns(self, connection: Connection, table_name: str, schema: str = None, **kw) -> List[Dict[str, Any]]:
-        if not self.has_table(connection, table_name, schema):
+        columns = self._get_columns(connection, table_name, schema, **kw)
+        if not columns:
+            # Every Trino table has at least one column, so no columns means no table
             raise exc.NoSuchTableError(f"schema={schema}, table={table_name}")
-        return self._get_columns(connection, table_name, schema, **kw)
+        return columns
 
     def _get_columns(self, connection: Connection, table_name: str, schema: str = None, **kw) -> List[Dict[str, Any]]:
         schema = schema or self._get_default_schema_name(connection)
-        query = dedent(
-            """
-            SELECT
-                "column_name",
-                "data_type",
-                "column_default",
-                UPPER("is_nullable") AS "is_nullable"
-            FROM "information_schema"."columns"
-            WHERE "table_schema" = :schema
-              AND "table_name" = :table
-            ORDER BY "ordinal_position" ASC
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema, "table": table_name})
-        columns = []
-        for record in res:
-            column = dict(
-                name=record.column_name,
-                type=datatype.parse_sqltype(record.data_type),
-                nullable=record.is_nullable == "YES",
-                default=record.column_default,
-            )
-            columns.append(column)
-        return columns
+        rows = self._execute_raw(connection, _COLUMNS_QUERY, [schema, table_name])
+        return [_to_column(row) for row in rows]
+
+    def get_multi_columns(
+        self,
+        connection: Connection,
+        schema: str = None,
+        filter_names: Sequence[str] = None,
+        scope: Any = None,
+        kind: Any = None,
+        **kw
+    ) -> List[Tuple[Tuple[Optional[str], str], List[Dict[str, Any]]]]:
+        """Reflects the columns of all requested tables with a single query. Used by SQLAlchemy 2.0+."""
+        table_names = self._get_reflected_table_names(connection, schema, filter_names, scope, kind, **kw)
+        if not table_names:
+            return []
+        query = _MULTI_COLUMNS_QUERY
+        params = [schema or self._get_default_schema_name(connection)]
+        if filter_names:
+            query += _in_list_filter("table_name", table_names)
+            params.extend(table_names)
+        query += '\nORDER BY "table_name", "ordinal_position" ASC'
+
+        columns: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self._execute_raw(connection, query, params):
+            columns.setdefault(row[0], []).append(_to_column(row[1:]))
+        return [((schema, table_name), columns[table_name]) for table_name in table_names if table_name in columns]
 
     def get_pk_constraint(self, connection: Connection, table_name: str, schema: str = None, **kw) -> Dict[str, Any]:
         """Trino has no support for primary keys. Returns a dummy"""
@@ -219,95 +374,77 @@ class TrinoDialect(DefaultDialect):
         return []
 
     def get_catalog_names(self, connection: Connection, **kw) -> List[str]:
-        query = dedent(
-            """
-            SELECT "table_cat"
-            FROM "system"."jdbc"."catalogs"
-        """
-        ).strip()
-        res = connection.execute(sql.text(query))
-        return [row.table_cat for row in res]
+        rows = self._execute_raw(connection, _CATALOG_NAMES_QUERY)
+        return [row[0] for row in rows]
 
     def get_schema_names(self, connection: Connection, **kw) -> List[str]:
-        query = dedent(
-            """
-            SELECT "schema_name"
-            FROM "information_schema"."schemata"
-        """
-        ).strip()
-        res = connection.execute(sql.text(query))
-        return [row.schema_name for row in res]
+        rows = self._execute_raw(connection, _SCHEMA_NAMES_QUERY)
+        return [row[0] for row in rows]
 
+    @_reflection_cache
     def get_table_names(self, connection: Connection, schema: str = None, **kw) -> List[str]:
         schema = schema or self._get_default_schema_name(connection)
         if schema is None:
             raise exc.NoSuchTableError("schema is required")
-        query = dedent(
-            """
-            SELECT "table_name"
-            FROM "information_schema"."tables"
-            WHERE "table_schema" = :schema
-              AND "table_type" = 'BASE TABLE'
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema})
-        return [row.table_name for row in res]
+        rows = self._execute_raw(connection, _TABLE_NAMES_QUERY, [schema])
+        return [row[0] for row in rows]
+
+    def get_multi_table_names(self, connection: Connection, schemas: Sequence[str], **kw) -> Dict[str, List[str]]:
+        """Returns the table names of all given schemas, fetched with a single query."""
+        table_names: Dict[str, List[str]] = {schema: [] for schema in schemas}
+        if not table_names:
+            return table_names
+        query = _MULTI_TABLE_NAMES_QUERY + _in_list_filter("table_schema", schemas)
+        for schema, table_name in self._execute_raw(connection, query, list(schemas)):
+            table_names[schema].append(table_name)
+        return table_names
 
     def get_temp_table_names(self, connection: Connection, schema: str = None, **kw) -> List[str]:
         """Trino has no support for temporary tables. Returns an empty list."""
         return []
 
+    @_reflection_cache
     def get_view_names(self, connection: Connection, schema: str = None, **kw) -> List[str]:
         schema = schema or self._get_default_schema_name(connection)
         if schema is None:
             raise exc.NoSuchTableError("schema is required")
-
-        # Querying the information_schema.views table is subpar as it compiles the view definitions.
-        query = dedent(
-            """
-            SELECT "table_name"
-            FROM "information_schema"."tables"
-            WHERE "table_schema" = :schema
-              AND "table_type" = 'VIEW'
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema})
-        return [row.table_name for row in res]
+        rows = self._execute_raw(connection, _VIEW_NAMES_QUERY, [schema])
+        return [row[0] for row in rows]
 
     def get_temp_view_names(self, connection: Connection, schema: str = None, **kw) -> List[str]:
         """Trino has no support for temporary views. Returns an empty list."""
         return []
 
+    @_reflection_cache
     def get_view_definition(self, connection: Connection, view_name: str, schema: str = None, **kw) -> str:
         schema = schema or self._get_default_schema_name(connection)
         if schema is None:
             raise exc.NoSuchTableError("schema is required")
-        query = dedent(
-            """
-            SELECT "view_definition"
-            FROM "information_schema"."views"
-            WHERE "table_schema" = :schema
-              AND "table_name" = :view
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema, "view": view_name})
+        res = connection.execute(_VIEW_DEFINITION_QUERY, {"schema": schema, "view": view_name})
         return res.scalar()
 
     def get_indexes(self, connection: Connection, table_name: str, schema: str = None, **kw) -> List[Dict[str, Any]]:
-        if not self.has_table(connection, table_name, schema):
-            raise exc.NoSuchTableError(f"schema={schema}, table={table_name}")
-
-        partitioned_columns = None
+        schema_name = schema or self._get_default_schema_name(connection)
         try:
-            partitioned_columns = self._get_columns(connection, f"{table_name}$partitions", schema, **kw)
+            # Fetches the partition columns and whether the table exists in a single round-trip
+            rows = self._execute_raw(
+                connection, _PARTITIONS_QUERY, [schema_name, f"{table_name}$partitions", schema_name, table_name]
+            )
         except Exception as e:
             # e.g. it's not a Hive table or an unpartitioned Hive table
             logger.debug("Couldn't fetch partition columns. schema: %s, table: %s, error: %s", schema, table_name, e)
+            if not self.has_table(connection, table_name, schema):
+                raise exc.NoSuchTableError(f"schema={schema}, table={table_name}")
+            return []
+        if not rows:
+            # There is always a row for the table itself if it exists
+            raise exc.NoSuchTableError(f"schema={schema}, table={table_name}")
+        partitioned_columns = [row[0] for row in rows if row[0] is not None]
         if not partitioned_columns:
             return []
         partition_index = dict(
             name="partition",
-            column_names=[col["name"] for col in partitioned_columns],
+            column_names=partitioned_columns,
             unique=False
         )
         return [partition_index]
@@ -335,18 +472,9 @@ class TrinoDialect(DefaultDialect):
         schema_name = schema or self._get_default_schema_name(connection)
         if schema_name is None:
             raise exc.NoSuchTableError("schema is required")
-        query = dedent(
-            """
-            SELECT "comment"
-            FROM "system"."metadata"."table_comments"
-            WHERE "catalog_name" = :catalog_name
-              AND "schema_name" = :schema_name
-              AND "table_name" = :table_name
-        """
-        ).strip()
         try:
             res = connection.execute(
-                sql.text(query),
+                _TABLE_COMMENT_QUERY,
                 {"catalog_name": catalog_name, "schema_name": schema_name, "table_name": table_name}
             )
             return dict(text=res.scalar())
@@ -357,31 +485,78 @@ class TrinoDialect(DefaultDialect):
                 return dict(text=None)
             raise
 
+    def get_multi_table_comment(
+        self,
+        connection: Connection,
+        schema: str = None,
+        filter_names: Sequence[str] = None,
+        scope: Any = None,
+        kind: Any = None,
+        **kw
+    ) -> List[Tuple[Tuple[Optional[str], str], Dict[str, Any]]]:
+        """Reflects the comments of all requested tables with a single query. Used by SQLAlchemy 2.0+."""
+        catalog_name = self._get_default_catalog_name(connection)
+        if catalog_name is None:
+            raise exc.NoSuchTableError("catalog is required in connection")
+        schema_name = schema or self._get_default_schema_name(connection)
+        if schema_name is None:
+            raise exc.NoSuchTableError("schema is required")
+        table_names = self._get_reflected_table_names(connection, schema, filter_names, scope, kind, **kw)
+        if not table_names:
+            return []
+        query = _MULTI_TABLE_COMMENT_QUERY
+        params = [catalog_name, schema_name]
+        if filter_names:
+            query += _in_list_filter("table_name", table_names)
+            params.extend(table_names)
+
+        try:
+            comments = dict(self._execute_raw(connection, query, params))
+        except error.TrinoQueryError as e:
+            if e.error_name in (
+                error.PERMISSION_DENIED,
+            ):
+                comments = {}
+            else:
+                raise
+        return [((schema, table_name), dict(text=comments.get(table_name))) for table_name in table_names]
+
+    def _get_reflected_table_names(
+        self, connection: Connection, schema: str, filter_names: Optional[Sequence[str]], scope: Any, kind: Any, **kw
+    ) -> List[str]:
+        # ObjectScope and ObjectKind are only available as of SQLAlchemy 2.0, which is the only caller of get_multi_*
+        from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+        scope = scope or ObjectScope.DEFAULT
+        kind = kind or ObjectKind.TABLE
+        if ObjectScope.DEFAULT not in scope:
+            # Trino has no support for temporary tables or views
+            return []
+        if filter_names and scope is ObjectScope.ANY and kind is ObjectKind.ANY:
+            # e.g. Table(..., autoload_with=...), take the names as given like SQLAlchemy does
+            return list(filter_names)
+
+        table_names = []
+        if ObjectKind.TABLE in kind:
+            table_names.extend(self.get_table_names(connection, schema, **kw))
+        if ObjectKind.VIEW in kind:
+            table_names.extend(self.get_view_names(connection, schema, **kw))
+        if filter_names:
+            requested = set(filter_names)
+            table_names = [table_name for table_name in table_names if table_name in requested]
+        return table_names
+
     def has_schema(self, connection: Connection, schema: str) -> bool:
-        query = dedent(
-            """
-            SELECT "schema_name"
-            FROM "information_schema"."schemata"
-            WHERE "schema_name" = :schema
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema})
-        return res.first() is not None
+        rows = self._execute_raw(connection, _HAS_SCHEMA_QUERY, [schema])
+        return len(rows) > 0
 
+    @_reflection_cache
     def has_table(self, connection: Connection, table_name: str, schema: str = None, **kw) -> bool:
         schema = schema or self._get_default_schema_name(connection)
         if schema is None:
             return False
-        query = dedent(
-            """
-            SELECT "table_name"
-            FROM "information_schema"."tables"
-            WHERE "table_schema" = :schema
-              AND "table_name" = :table
-        """
-        ).strip()
-        res = connection.execute(sql.text(query), {"schema": schema, "table": table_name})
-        return res.first() is not None
+        rows = self._execute_raw(connection, _HAS_TABLE_QUERY, [schema, table_name])
+        return len(rows) > 0
 
     def has_sequence(self, connection: Connection, sequence_name: str, schema: str = None, **kw) -> bool:
         """Trino has no support for sequence. Returns False indicate that given sequence does not exists."""
@@ -390,9 +565,8 @@ class TrinoDialect(DefaultDialect):
     @classmethod
     def _get_server_version_info(cls, connection: Connection) -> Any:
         def get_server_version_info(_):
-            query = "SELECT version()"
             try:
-                res = connection.execute(sql.text(query))
+                res = connection.execute(_VERSION_QUERY)
                 version = res.scalar()
                 return tuple([version])
             except exc.ProgrammingError as e:
@@ -407,6 +581,18 @@ class TrinoDialect(DefaultDialect):
             return connection.raw_connection()
         return connection.connection
 
+    def _execute_raw(self, connection: Connection, query: str, params: List[Any] = None) -> List[List[Any]]:
+        """Run a metadata query directly on the DBAPI cursor.
+
+        Rows are returned as plain lists, skipping the per-row overhead of SQLAlchemy result processing.
+        """
+        cursor = self._raw_connection(connection).cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
     def _get_default_catalog_name(self, connection: Connection) -> Optional[str]:
         dbapi_connection: trino_dbapi.Connection = self._raw_connection(connection)
         return dbapi_connection.catalog